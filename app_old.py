@@ -1,4 +1,3 @@
-import asyncio
 import threading
 from datetime import datetime
 
@@ -6,13 +5,13 @@ import pandas as pd
 from dash import Dash, html, dcc, Output, Input, dash_table
 import dash_bootstrap_components as dbc
 
-from credit_monitor_extended import Config, TelegramNotifier, fetch_consumer_credit, fetch_hy_spread, fetch_nfci
+from credit_monitor_extended import fetch_consumer_credit, fetch_hy_spread, fetch_nfci
+# Shared Telegram send path; this file keeps its own loader and latest-value table
+from dashboard_core import cfg, queue_telegram
 
 # ============================================================
 # 1️⃣ Setup
 # ============================================================
-cfg = Config()
-notifier = TelegramNotifier(cfg.TELEGRAM_TOKEN, cfg.CHAT_ID)
 app = Dash(__name__, external_stylesheets=[dbc.themes.SANDSTONE])
 app.title = "Credit Market Monitor"
 
@@ -32,9 +31,9 @@ def load_data():
             round(nf.iloc[-1]["nfci"], 2)
         ],
         "Last Updated": [
-            cc.index.max().strftime("%Y-%m-%d"),
-            hy.index.max().strftime("%Y-%m-%d"),
-            nf.index.max().strftime("%Y-%m-%d")
+            cc.index[-1].strftime("%Y-%m-%d"),
+            hy.index[-1].strftime("%Y-%m-%d"),
+            nf.index[-1].strftime("%Y-%m-%d")
         ]
     })
     return latest
@@ -90,8 +89,7 @@ def send_summary(n_clicks):
         f"• HY Spread: {df.iloc[1]['Latest Value']} bps\n"
         f"• NFCI: {df.iloc[2]['Latest Value']}"
     )
-    asyncio.run(notifier.send(msg))
-    return f"✅ Telegram alert sent at {datetime.now().strftime('%H:%M:%S')}"
+    return queue_telegram(msg)
 
 # ============================================================
 # 5️⃣ Run server
@@ -9,23 +9,19 @@ Features:
 - Telegram summary alert button
 """
 
-import asyncio
 from datetime import datetime
 import pandas as pd
 import plotly.graph_objects as go
-from dash import Dash, html, dcc, dash_table, Output, Input
+from dash import Dash, html, dcc, Output, Input
 import dash_bootstrap_components as dbc
 
-from credit_monitor_extended import (
-    Config, TelegramNotifier,
-    fetch_consumer_credit, fetch_hy_spread, fetch_nfci
-)
+from credit_monitor_extended import fetch_consumer_credit, fetch_hy_spread, fetch_nfci
+# Shared summary table + Telegram send path; this file keeps its own loader and chart
+from dashboard_core import cfg, make_summary_table, queue_telegram
 
 # ============================================================
 # 1️⃣ Setup
 # ============================================================
-cfg = Config()
-notifier = TelegramNotifier(cfg.TELEGRAM_TOKEN, cfg.CHAT_ID)
 app = Dash(__name__, external_stylesheets=[dbc.themes.SANDSTONE])
 app.title = "Credit Market Dashboard"
 
@@ -91,32 +87,7 @@ def make_chart(df):
     return fig
 
 # ============================================================
-# 4️⃣ Summary Table Builder
-# ============================================================
-def make_summary_table(df: pd.DataFrame):
-    """Return DataTable showing the 3 latest values for each series."""
-    latest_dates = []
-    for col in df.columns:
-        last_rows = df[[col]].dropna().tail(3)
-        for idx, val in last_rows.iterrows():
-            latest_dates.append({
-                "Indicator": col,
-                "Date": idx.strftime("%Y-%m-%d"),
-                "Value": round(val[col], 2)
-            })
-    table_df = pd.DataFrame(latest_dates)
-
-    return dash_table.DataTable(
-        data=table_df.to_dict("records"),
-        columns=[{"name": i, "id": i} for i in table_df.columns],
-        style_table={"overflowX": "auto"},
-        style_cell={"textAlign": "center", "padding": "6px"},
-        style_header={"backgroundColor": "#f8f9fa", "fontWeight": "bold"},
-        page_size=9
-    )
-
-# ============================================================
-# 5️⃣ Layout
+# 4️⃣ Layout
 # ============================================================
 app.layout = dbc.Container([
     html.H2("📊 U.S. Credit Market Dashboard"),
@@ -141,7 +112,7 @@ app.layout = dbc.Container([
 ], fluid=True, className="p-4")
 
 # ============================================================
-# 6️⃣ Callbacks
+# 5️⃣ Callbacks
 # ============================================================
 @app.callback(
     Output("credit_chart", "figure"),
@@ -171,11 +142,10 @@ def send_summary(n_clicks):
         f"• HY Spread: {latest['HY Spread (bps)']:.0f} bps\n"
         f"• NFCI: {latest['NFCI Index']:.2f}"
     )
-    asyncio.run(notifier.send(msg))
-    return f"✅ Telegram summary sent at {datetime.now().strftime('%H:%M:%S')}"
+    return queue_telegram(msg)
 
 # ============================================================
-# 7️⃣ Run
+# 6️⃣ Run
 # ============================================================
 if __name__ == "__main__":
     app.run(host="127.0.0.1", port=8050, debug=True)
@@ -103,16 +103,12 @@ def make_chart(df):
 # ============================================================
 def make_summary_table(df: pd.DataFrame):
     """Return DataTable showing the 3 latest values for each series."""
+    # (col, date, value) tuples, columns named once in from_records
     latest_dates = []
     for col in df.columns:
-        last_rows = df[[col]].dropna().tail(3)
-        for idx, val in last_rows.iterrows():
-            latest_dates.append({
-                "Indicator": col,
-                "Date": idx.strftime("%Y-%m-%d"),
-                "Value": round(val[col], 2)
-            })
-    table_df = pd.DataFrame(latest_dates)
+        for idx, val in df[col].dropna().tail(3).items():
+            latest_dates.append((col, idx.strftime("%Y-%m-%d"), round(val, 2)))
+    table_df = pd.DataFrame.from_records(latest_dates, columns=["Indicator", "Date", "Value"])
 
     return dash_table.DataTable(
         data=table_df.to_dict("records"),
@@ -9,24 +9,22 @@ Features:
 - Telegram summary alert button
 """
 
-import asyncio
 from datetime import datetime
 import pandas as pd
 import plotly.graph_objects as go
-from dash import Dash, html, dcc, dash_table, Output, Input
+from dash import Dash, html, dcc, Output, Input
 import dash_bootstrap_components as dbc
 
 from credit_monitor_extended import (
-    Config, TelegramNotifier,
     fetch_consumer_credit, fetch_hy_spread,
     fetch_nfci, fetch_sentiment, fetch_vix  # 🟠 added
 )
+# Shared summary table + Telegram send path; this file keeps its own loader and chart
+from dashboard_core import cfg, make_summary_table, queue_telegram
 
 # ============================================================
 # 1️⃣ Setup
 # ============================================================
-cfg = Config()
-notifier = TelegramNotifier(cfg.TELEGRAM_TOKEN, cfg.CHAT_ID)
 app = Dash(__name__, external_stylesheets=[dbc.themes.SANDSTONE])
 app.title = "Credit Market Dashboard"
 
@@ -124,8 +122,7 @@ def send_summary(n_clicks):
         f"• Sentiment: {latest['Consumer Sentiment Index']:.2f}\n"
         f"• VIX: {latest['VIX Index']:.2f}"  # 🟠 new line
     )
-    asyncio.run(notifier.send(msg))
-    return f"✅ Telegram summary sent at {datetime.now().strftime('%H:%M:%S')}"
+    return queue_telegram(msg)
 
 # ============================================================
 # 5️⃣ Layout
@@ -170,29 +167,8 @@ def update_dashboard(n_intervals):
     if df.empty:
         return fig, html.P("⚠️ No data available", className="text-danger")
 
-    # Build latest-values summary table — include ALL columns (including VIX)
-    latest_dates = []
-    for col in df.columns:
-        last_rows = df[[col]].dropna().tail(3)
-        for idx, val in last_rows.iterrows():
-            latest_dates.append({
-                "Indicator": col,
-                "Date": idx.strftime("%Y-%m-%d"),
-                "Value": round(val[col], 2)
-            })
-
-    table_df = pd.DataFrame(latest_dates)
-
-    table = dash_table.DataTable(
-        data=table_df.to_dict("records"),
-        columns=[{"name": i, "id": i} for i in table_df.columns],
-        style_table={"overflowX": "auto"},
-        style_cell={"textAlign": "center", "padding": "6px"},
-        style_header={"backgroundColor": "#f8f9fa", "fontWeight": "bold"},
-        page_size=15,  # ⬆️ slightly higher to fit all 5 indicators × 3 rows
-    )
-
-    return fig, table
+    # Latest-values summary table — ALL columns (including VIX), 5 indicators × 3 rows
+    return fig, make_summary_table(df)
 # ============================================================
 # 7️⃣ Run
 # ============================================================
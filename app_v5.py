@@ -103,16 +103,12 @@ def make_chart(df):
 # 4️⃣ Summary Table
 # ============================================================
 def make_summary_table(df: pd.DataFrame):
+    # tuple rows: no per-row dict
     latest_records = []
     for col in df.columns:
-        last_rows = df[[col]].dropna().tail(3)
-        for idx, val in last_rows.iterrows():
-            latest_records.append({
-                "Indicator": col,
-                "Date": idx.strftime("%Y-%m-%d"),
-                "Value": round(val[col], 2)
-            })
-    table_df = pd.DataFrame(latest_records)
+        for idx, val in df[col].dropna().tail(3).items():
+            latest_records.append((col, idx.strftime("%Y-%m-%d"), round(val, 2)))
+    table_df = pd.DataFrame.from_records(latest_records, columns=["Indicator", "Date", "Value"])
 
     return dash_table.DataTable(
         data=table_df.to_dict("records"),
@@ -9,24 +9,26 @@ Features:
 - Telegram summary alert button
 """
 
-import asyncio
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 import pandas as pd
 import plotly.graph_objects as go
 from dash import Dash, html, dcc, dash_table, Output, Input
 import dash_bootstrap_components as dbc
 
 from credit_monitor_extended import (
-    Config, TelegramNotifier,
+    Config,
     fetch_consumer_credit, fetch_hy_spread,
     fetch_nfci, fetch_sentiment, fetch_vix
 )
+# Shared config + Telegram send path; this file keeps its own loader and chart
+from dashboard_core import cfg, queue_telegram
 
 # ============================================================
 # 1️⃣ Setup
 # ============================================================
-cfg = Config()
-notifier = TelegramNotifier(cfg.TELEGRAM_TOKEN, cfg.CHAT_ID)
 app = Dash(__name__, external_stylesheets=[dbc.themes.SANDSTONE])
 app.title = "U.S. Credit Market Dashboard"
 
@@ -34,6 +36,14 @@ app.title = "U.S. Credit Market Dashboard"
 # 2️⃣ Data Loader
 # ============================================================
 def load_data():
+    """Merged 2-year frame, held in-process for the current clock hour."""
+    return _load_data_cached(int(time.time() // 3600))
+
+
+@lru_cache(maxsize=2)
+def _load_data_cached(hour_key):
+    # hour_key only rolls the entry over, on the same hour as FredFetcher's disk cache;
+    # refreshes and send clicks within the hour skip FRED and the concat
     cc = fetch_consumer_credit(cfg.START_DATE)
     hy = fetch_hy_spread(cfg.START_DATE)
     nf = fetch_nfci(cfg.START_DATE)
@@ -46,21 +56,55 @@ def load_data():
     sent = sent.rename(columns={"consumer_sentiment": "Consumer Sentiment Index"})
     vix = vix.rename(columns={"vix": "VIX Index"})
 
-    df = cc[["Consumer Credit Growth (%)"]].join(
-        hy[["HY Spread (bps)"]], how="outer"
-    ).join(nf[["NFCI Index"]], how="outer").join(
-        sent[["Consumer Sentiment Index"]], how="outer"
-    ).join(vix[["VIX Index"]], how="outer")
+    # --- One aligned outer concat (sorted union index) instead of four pairwise joins ---
+    series = [
+        cc["Consumer Credit Growth (%)"],
+        hy["HY Spread (bps)"],
+        nf["NFCI Index"],
+        sent["Consumer Sentiment Index"],
+        vix["VIX Index"]
+    ]
+    df = pd.concat(series, axis=1, sort=True).ffill()
+    if df.empty:
+        return df  # no data from FRED: make_chart draws its placeholder
 
-    df = df.sort_index().ffill()
-    df = df[df.index >= (df.index.max() - pd.DateOffset(years=2))]
+    # --- Index is already sorted: binary-search the 2-year cutoff, no boolean mask ---
+    cutoff = df.index[-1] - pd.DateOffset(years=2)
+    df = df.iloc[df.index.searchsorted(cutoff):]
     return df
 
 
+def load_latest() -> dict | None:
+    """Last merged row as {column: float}, read off the in-process cached frame."""
+    df = load_data()
+    if df.empty:
+        return None
+    return dict(zip(df.columns, df.iloc[-1].to_numpy(dtype=float).tolist()))
+
+
 # ============================================================
 # 3️⃣ Chart Builder (raw data)
 # ============================================================
+# last two figures built, so refreshes within the hour skip the Plotly build
+_chart_cache = {}  # {(hour, last_ts, shape): fig}, oldest first
+_chart_lock = threading.Lock()  # Flask serves callbacks from several threads
+
+
 def make_chart(df):
+    """Return the figure for df, rebuilt only when the data has advanced."""
+    # key = (clock hour, last date, shape): the hour rolls it over with load_data's cache,
+    # so a same-date revision is drawn once the frame is refetched
+    key = (int(time.time() // 3600), df.index[-1] if not df.empty else None, df.shape)
+    with _chart_lock:
+        fig = _chart_cache.get(key)
+        if fig is None:
+            fig = _chart_cache[key] = _make_chart(df)
+            while len(_chart_cache) > 2:
+                del _chart_cache[next(iter(_chart_cache))]
+    return fig
+
+
+def _make_chart(df):
     if df.empty:
         fig = go.Figure()
         fig.add_annotation(
@@ -148,12 +192,12 @@ def make_chart(df):
 
     # Right axis thresholds (market indicators)
     fig.add_shape(
-        type="line", x0=df.index.min(), x1=df.index.max(),
+        type="line", x0=df.index[0], x1=df.index[-1],
         y0=cfg.HY_SPREAD_THRESHOLD, y1=cfg.HY_SPREAD_THRESHOLD,
         yref="y2", xref="x", line=dict(color="red", dash="dot"),
     )
     fig.add_shape(
-        type="line", x0=df.index.min(), x1=df.index.max(),
+        type="line", x0=df.index[0], x1=df.index[-1],
         y0=cfg.VIX_THRESHOLD, y1=cfg.VIX_THRESHOLD,
         yref="y2", xref="x", line=dict(color="orange", dash="dot"),
     )
@@ -193,20 +237,22 @@ def make_threshold_cards(cfg: Config):
     )
 
 
+# cfg is fixed for the process lifetime, so the cards are built once
+THRESHOLD_CARDS = make_threshold_cards(cfg)
+
+
 # ============================================================
 # 5️⃣ Summary Table Builder
 # ============================================================
 def make_summary_table(df: pd.DataFrame):
-    latest_records = []
-    for col in df.columns:
-        last_rows = df[[col]].dropna().tail(3)
-        for idx, val in last_rows.iterrows():
-            latest_records.append({
-                "Indicator": col,
-                "Date": idx.strftime("%Y-%m-%d"),
-                "Value": round(val[col], 2)
-            })
-    table_df = pd.DataFrame(latest_records)
+    # --- Last 3 observations per indicator via melt + groupby tail (no iterrows) ---
+    long = df.rename_axis("Date").reset_index().melt(
+        id_vars="Date", var_name="Indicator", value_name="Value"
+    ).dropna(subset=["Value"])
+    table_df = long.groupby("Indicator", sort=False).tail(3).assign(
+        Date=lambda d: d["Date"].dt.strftime("%Y-%m-%d"),
+        Value=lambda d: d["Value"].round(2)
+    )[["Indicator", "Date", "Value"]]
 
     return dash_table.DataTable(
         data=table_df.to_dict("records"),
@@ -267,8 +313,7 @@ def update_dashboard(n_intervals):
     df = load_data()
     fig = make_chart(df)
     table = make_summary_table(df)
-    cards = make_threshold_cards(cfg)
-    return fig, table, cards
+    return fig, table, THRESHOLD_CARDS
 
 
 @app.callback(
@@ -278,20 +323,18 @@ def update_dashboard(n_intervals):
 )
 
 def send_summary(n_clicks):
-    df = load_data()
-    if df.empty:
+    vals = load_latest()
+    if vals is None:
         return "⚠️ Data unavailable — cannot send summary."
-    latest = df.iloc[-1]
     msg = (
         f"📊 <b>Credit Dashboard Update ({datetime.now():%Y-%m-%d %H:%M})</b>\n"
-        f"• Consumer Credit: {latest['Consumer Credit Growth (%)']:.2f}%\n"
-        f"• HY Spread: {latest['HY Spread (bps)']:.0f} bps\n"
-        f"• NFCI: {latest['NFCI Index']:.2f}\n"
-        f"• Sentiment: {latest['Consumer Sentiment Index']:.2f}\n"
-        f"• VIX: {latest['VIX Index']:.2f}"
+        f"• Consumer Credit: {vals['Consumer Credit Growth (%)']:.2f}%\n"
+        f"• HY Spread: {vals['HY Spread (bps)']:.0f} bps\n"
+        f"• NFCI: {vals['NFCI Index']:.2f}\n"
+        f"• Sentiment: {vals['Consumer Sentiment Index']:.2f}\n"
+        f"• VIX: {vals['VIX Index']:.2f}"
     )
-    asyncio.run(notifier.send(msg))
-    return f"✅ Telegram summary sent at {datetime.now().strftime('%H:%M:%S')}"
+    return queue_telegram(msg)
 
 
 # ============================================================
@@ -13,12 +13,23 @@ Sends Telegram alerts when:
 """
 
 import os
-from datetime import datetime, date
+import json
+import hashlib
+import html
+import asyncio
+import operator
+from datetime import datetime, date, timedelta
+from typing import Callable, NamedTuple
 import pandas as pd
 from pandas_datareader import data as web
+import requests
+from requests.adapters import HTTPAdapter
 from telegram import Bot
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
-import html
+
+from fred_cache import FileCache
 
 # ============================================================
 # 1️⃣ Configuration
@@ -54,22 +65,45 @@ class Config:
 # ============================================================
 # 2️⃣ Data Fetchers
 # ============================================================
+class _PersistentSession(requests.Session):
+    # pandas_datareader closes the session it is given after every read; keep the pool open
+    def close(self):
+        pass
+
+
+def _make_session(pool_size: int = 8) -> requests.Session:
+    session = _PersistentSession()
+    session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+    return session
+
+
 class FredFetcher:
-    """Unified FRED data fetcher."""
+    """Unified FRED data fetcher (responses persisted to Parquet for the clock hour, one entry per series/start)."""
+    cache = FileCache()
+    session = _make_session()  # one keep-alive pool shared by every series (and fetch thread)
+
     def __init__(self, series_name: str):
         self.series_name = series_name
 
     def fetch(self, start: str, end: str | None = None) -> pd.DataFrame:
+        # open-ended fetches share one entry that each refetch overwrites
+        key = start if end is None else f"{start}_{end}"
         if end is None:
             end = datetime.now().strftime("%Y-%m-%d")
-        df = web.DataReader(self.series_name, "fred", start, end).dropna()
+        df = self.cache.get(self.series_name, key)
+        if df is not None:
+            return df
+        df = web.DataReader(self.series_name, "fred", start, end, session=self.session).dropna()
+        # FRED returns ascending dates; only pay for a sort if that ever changes
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        self.cache.set(self.series_name, key, df)
         return df
 
 
 def fetch_consumer_credit(start='2000-01-01', end=None):
     df = FredFetcher("TOTALSLAR").fetch(start, end)
     df.columns = ['pct_change_consumer_credit']
-    df["latest_date"] = df.index
     return df
 
 
@@ -77,28 +111,24 @@ def fetch_hy_spread(start='2000-01-01', end=None):
     df = FredFetcher("BAMLH0A0HYM2").fetch(start, end)
     df.columns = ['hy_oas']
     df["hy_oas_bps"] = df["hy_oas"] * 100
-    df["latest_date"] = df.index
     return df
 
 
 def fetch_nfci(start='2000-01-01', end=None):
     df = FredFetcher("NFCI").fetch(start, end)
     df.columns = ['nfci']
-    df["latest_date"] = df.index
     return df
 
 
 def fetch_sentiment(start='2000-01-01', end=None):
     df = FredFetcher("UMCSENT").fetch(start, end)
     df.columns = ['consumer_sentiment']
-    df["latest_date"] = df.index
     return df
 
 
 def fetch_vix(start='2000-01-01', end=None):
     df = FredFetcher("VIXCLS").fetch(start, end)
     df.columns = ['vix']
-    df["latest_date"] = df.index
     return df
 
 
@@ -106,104 +136,195 @@ def fetch_vix(start='2000-01-01', end=None):
 # 3️⃣ Telegram Notifier
 # ============================================================
 class TelegramNotifier:
+    MAX_MESSAGE_LEN = 4096  # Telegram's limit, counted in UTF-16 code units
+    MAX_RETRIES = 3         # flood-control (429) retries per message
+
     def __init__(self, token: str, chat_id: str):
-        self.bot = Bot(token=token)
+        # PTB's default pool holds one connection; concurrent sends need room to share it
+        self._request = HTTPXRequest(connection_pool_size=8)
+        self.bot = Bot(token=token, request=self._request)
         self.chat_id = chat_id
 
+    async def __aenter__(self):
+        # (re)open the pooled httpx client on the running loop; every send inside reuses it
+        await self._request.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # close keep-alive connections before the loop that owns them goes away
+        await self._request.shutdown()
+
     async def send(self, message: str):
+        """Send as HTML; callers pass ready markup (formatted numbers, literal < > written as entities)."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        safe_message = html.escape(message)
         print(f"[{timestamp}] {message}")
-        try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=safe_message,
-                parse_mode="HTML"
-            )
-        except Exception as e:
-            print(f"⚠️ Telegram send error: {e}")
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                await self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text=message,
+                    parse_mode="HTML"
+                )
+                return
+            except RetryAfter as e:
+                # 429: wait as long as Telegram asks, then retry (bounded)
+                if attempt == self.MAX_RETRIES:
+                    print(f"⚠️ Telegram send error: {e}")
+                    return
+                await asyncio.sleep(e.retry_after)
+            except Exception as e:
+                print(f"⚠️ Telegram send error: {e}")
+                return
+
+    async def send_lines(self, lines: list[str]):
+        """Send lines as one newline-joined message, split only where it would pass the limit."""
+        messages, chunk, size = [], [], 0
+        for line in lines:
+            n = len(line.encode("utf-16-le")) // 2 + 1  # + newline
+            if chunk and size + n > self.MAX_MESSAGE_LEN:
+                messages.append("\n".join(chunk))
+                chunk, size = [], 0
+            chunk.append(line)
+            size += n
+        if chunk:
+            messages.append("\n".join(chunk))
+        # --- Overflow parts go out concurrently over the pooled connection ---
+        await asyncio.gather(*(self.send(m) for m in messages))
 
 
 # ============================================================
 # 4️⃣ Credit Monitor Logic
 # ============================================================
+class IndicatorSpec(NamedTuple):
+    """One monitored series: where it comes from and how its alerts read."""
+    key: str                                  # state.json key
+    fetch_fn: Callable[..., pd.DataFrame]
+    value_col: str
+    threshold: float
+    breached: Callable[[float, float], bool]  # operator.lt / operator.gt
+    new_msg: str                              # templates over {date}, {value}, {threshold}
+    breach_msg: str
+    stale_msg: str | None = None              # set to also alert when the series goes stale
+
+
+def make_indicators(cfg: Config) -> list[IndicatorSpec]:
+    return [
+        IndicatorSpec(
+            "consumer_credit", fetch_consumer_credit, "pct_change_consumer_credit",
+            cfg.CREDIT_THRESHOLD, operator.lt,
+            "🆕 New Consumer Credit data ({date}): {value:.2f}%",
+            "📉 Credit Warning: growth {value:.2f}% (&lt;{threshold}%)",
+            stale_msg="⚠️ Consumer credit data is stale."
+        ),
+        IndicatorSpec(
+            "hy_spread", fetch_hy_spread, "hy_oas_bps",
+            cfg.HY_SPREAD_THRESHOLD, operator.gt,
+            "🆕 New HY Spread data ({date}): {value:.0f} bps",
+            "🚨 HY Spread above {threshold} bps: {value:.0f} bps"
+        ),
+        IndicatorSpec(
+            "nfci", fetch_nfci, "nfci",
+            cfg.NFCI_THRESHOLD, operator.gt,
+            "🆕 New NFCI data ({date}): {value:.2f}",
+            "📈 NFCI turned positive ({value:.2f}) — tightening conditions."
+        ),
+        IndicatorSpec(
+            "consumer_sentiment", fetch_sentiment, "consumer_sentiment",
+            cfg.SENTIMENT_THRESHOLD, operator.lt,
+            "🆕 New Consumer Sentiment data ({date}): {value:.2f}",
+            "⚠️ Sentiment low: {value:.2f} (&lt;{threshold})"
+        ),
+        IndicatorSpec(
+            "vix", fetch_vix, "vix",
+            cfg.VIX_THRESHOLD, operator.gt,
+            "🆕 New VIX data ({date}): {value:.2f}",
+            "⚠️ VIX Warning: {value:.2f} (&gt; {threshold})"
+        )
+    ]
+
+
 class CreditMonitor:
+    STATE_PATH = os.path.join("cache", "state.json")
+
     def __init__(self, config: Config):
         self.cfg = config
         self.notifier = TelegramNotifier(config.TELEGRAM_TOKEN, config.CHAT_ID)
+        self.indicators = make_indicators(config)
+        os.makedirs(os.path.dirname(self.STATE_PATH), exist_ok=True)
+        # last-seen observation hash per indicator, read once and written back once per run
+        self._state = self._load_state()
+        self._dirty = False
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.STATE_PATH, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_state(self):
+        if not self._dirty:
+            return
+        tmp_path = f"{self.STATE_PATH}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self.STATE_PATH)  # atomic: readers never see a partial file
+        self._dirty = False
 
     def _check_staleness(self, latest_date: date) -> bool:
-        today = datetime.now().date()
-        return (today - latest_date).days > self.cfg.STALE_DAYS
-
-    def _compare_new_data(self, df: pd.DataFrame, cache_file: str) -> bool:
-        latest_date = df.index.max().date()
-        os.makedirs("cache", exist_ok=True)
-        path = os.path.join("cache", cache_file)
-        if not os.path.exists(path):
-            with open(path, "w") as f:
-                f.write(str(latest_date))
-            return True
-        with open(path, "r") as f:
-            prev_date = f.read().strip()
-        if prev_date != str(latest_date):
-            with open(path, "w") as f:
-                f.write(str(latest_date))
-            return True
-        return False
+        return latest_date < self._stale_cutoff
+
+    @staticmethod
+    def _latest(df: pd.DataFrame, col: str) -> tuple[date, float]:
+        """Last observation as plain scalars — all run() needs from each frame."""
+        last = df.iloc[-1]
+        return last.name.date(), float(last[col])
+
+    def _compare_new_data(self, key: str, latest_date: date, latest_value: float) -> bool:
+        # hash of the last (date, value): a revised latest print also counts as new data
+        digest = hashlib.md5(f"{latest_date}|{latest_value:.6f}".encode()).hexdigest()
+        if self._state.get(key) == digest:
+            return False
+        self._state[key] = digest
+        self._dirty = True
+        return True
+
+    async def _process(self, spec: IndicatorSpec) -> list[str]:
+        """Fetch one series and return its alert lines; the frame is freed before returning."""
+        # blocking HTTP → worker thread; any failure (fetch or an empty/malformed frame)
+        # becomes an alert so one bad series doesn't abort the run
+        try:
+            df = await asyncio.to_thread(spec.fetch_fn, self.cfg.START_DATE)
+            latest_date, latest_value = self._latest(df, spec.value_col)
+            del df  # only the two scalars are needed from here on
+            return self._alerts_for(spec, latest_date, latest_value)
+        except Exception as e:
+            # exception text is arbitrary: escape it for the HTML message
+            return [f"⚠️ {spec.key} fetch failed: {html.escape(str(e))}"]
+
+    def _alerts_for(self, spec: IndicatorSpec, latest_date: date, latest_value: float) -> list[str]:
+        alerts = []
+        fields = {"date": latest_date, "value": latest_value, "threshold": spec.threshold}
+        if self._compare_new_data(spec.key, latest_date, latest_value):
+            alerts.append(spec.new_msg.format_map(fields))
+        if spec.stale_msg and self._check_staleness(latest_date):
+            alerts.append(spec.stale_msg)
+        if spec.breached(latest_value, spec.threshold):
+            alerts.append(spec.breach_msg.format_map(fields))
+        return alerts
 
     async def run(self):
         """Fetch all indicators and send alerts as needed."""
+        async with self.notifier:
+            self._today = datetime.now().date()  # one clock read per run
+            self._stale_cutoff = self._today - timedelta(days=self.cfg.STALE_DAYS)
+
+            # --- Fetch and check every series concurrently; results come back in table order ---
+            results = await asyncio.gather(*(self._process(spec) for spec in self.indicators))
+            alerts = [line for lines in results for line in lines]
+
+            self._save_state()
 
-        # ---------- Consumer Credit ----------
-        cc = fetch_consumer_credit(self.cfg.START_DATE)
-        cc_latest_date = cc.index.max().date()
-        cc_latest_value = cc.iloc[-1]['pct_change_consumer_credit']
-        cc_stale = self._check_staleness(cc_latest_date)
-        cc_new = self._compare_new_data(cc, "consumer_credit.txt")
-        if cc_new:
-            await self.notifier.send(f"🆕 New Consumer Credit data ({cc_latest_date}): {cc_latest_value:.2f}%")
-        if cc_stale:
-            await self.notifier.send("⚠️ Consumer credit data is stale.")
-        if cc_latest_value < self.cfg.CREDIT_THRESHOLD:
-            await self.notifier.send(f"📉 Credit Warning: growth {cc_latest_value:.2f}% (<{self.cfg.CREDIT_THRESHOLD}%)")
-
-        # ---------- High-Yield Spread ----------
-        hy = fetch_hy_spread(self.cfg.START_DATE)
-        hy_latest_date = hy.index.max().date()
-        hy_latest_value = hy.iloc[-1]['hy_oas_bps']
-        hy_new = self._compare_new_data(hy, "hy_spread.txt")
-        if hy_new:
-            await self.notifier.send(f"🆕 New HY Spread data ({hy_latest_date}): {hy_latest_value:.0f} bps")
-        if hy_latest_value > self.cfg.HY_SPREAD_THRESHOLD:
-            await self.notifier.send(f"🚨 HY Spread above {self.cfg.HY_SPREAD_THRESHOLD} bps: {hy_latest_value:.0f} bps")
-
-        # ---------- Financial Conditions ----------
-        nfci = fetch_nfci(self.cfg.START_DATE)
-        nfci_latest_date = nfci.index.max().date()
-        nfci_latest_value = nfci.iloc[-1]['nfci']
-        nfci_new = self._compare_new_data(nfci, "nfci.txt")
-        if nfci_new:
-            await self.notifier.send(f"🆕 New NFCI data ({nfci_latest_date}): {nfci_latest_value:.2f}")
-        if nfci_latest_value > self.cfg.NFCI_THRESHOLD:
-            await self.notifier.send(f"📈 NFCI turned positive ({nfci_latest_value:.2f}) — tightening conditions.")
-
-        # ---------- Consumer Sentiment ----------
-        sent = fetch_sentiment(self.cfg.START_DATE)
-        sent_latest_date = sent.index.max().date()
-        sent_latest_value = sent.iloc[-1]['consumer_sentiment']
-        sent_new = self._compare_new_data(sent, "consumer_sentiment.txt")
-        if sent_new:
-            await self.notifier.send(f"🆕 New Consumer Sentiment data ({sent_latest_date}): {sent_latest_value:.2f}")
-        if sent_latest_value < self.cfg.SENTIMENT_THRESHOLD:
-            await self.notifier.send(f"⚠️ Sentiment low: {sent_latest_value:.2f} (<{self.cfg.SENTIMENT_THRESHOLD})")
-
-        # ---------- VIX Index ----------
-        vix = fetch_vix(self.cfg.START_DATE)
-        vix_latest_date = vix.index.max().date()
-        vix_latest_value = vix.iloc[-1]['vix']
-        vix_new = self._compare_new_data(vix, "vix.txt")
-        if vix_new:
-            await self.notifier.send(f"🆕 New VIX data ({vix_latest_date}): {vix_latest_value:.2f}")
-        if vix_latest_value > self.cfg.VIX_THRESHOLD:
-            await self.notifier.send(f"⚠️ VIX Warning: {vix_latest_value:.2f} (> {self.cfg.VIX_THRESHOLD})")
+            # --- One Telegram round-trip for the whole run ---
+            if alerts:
+                await self.notifier.send_lines(alerts)
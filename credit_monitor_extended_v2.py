@@ -138,7 +138,7 @@ class CreditMonitor:
 
     def _compare_new_data(self, df: pd.DataFrame, cache_file: str) -> bool:
         """Return True if the latest data date is new compared to cache file."""
-        latest_date = df.index.max().date()
+        latest_date = df.index[-1].date()
         os.makedirs("cache", exist_ok=True)
         path = os.path.join("cache", cache_file)
         if not os.path.exists(path):
@@ -158,7 +158,7 @@ class CreditMonitor:
 
         # ---------- Consumer Credit ----------
         cc = fetch_consumer_credit(self.cfg.START_DATE)
-        cc_latest_date = cc.index.max().date()
+        cc_latest_date = cc.index[-1].date()
         cc_latest_value = cc.iloc[-1]['pct_change_consumer_credit']
         cc_stale = self._check_staleness(cc_latest_date)
         cc_new = self._compare_new_data(cc, "consumer_credit.txt")
@@ -172,7 +172,7 @@ class CreditMonitor:
 
         # ---------- High-Yield Spread ----------
         hy = fetch_hy_spread(self.cfg.START_DATE)
-        hy_latest_date = hy.index.max().date()
+        hy_latest_date = hy.index[-1].date()
         hy_latest_value = hy.iloc[-1]['hy_oas_bps']
         hy_new = self._compare_new_data(hy, "hy_spread.txt")
 
@@ -183,7 +183,7 @@ class CreditMonitor:
 
         # ---------- Financial Conditions (NFCI) ----------
         nfci = fetch_nfci(self.cfg.START_DATE)
-        nfci_latest_date = nfci.index.max().date()
+        nfci_latest_date = nfci.index[-1].date()
         nfci_latest_value = nfci.iloc[-1]['nfci']
         nfci_new = self._compare_new_data(nfci, "nfci.txt")
 
@@ -194,7 +194,7 @@ class CreditMonitor:
 
         # ---------- Consumer Sentiment ----------
         sent = fetch_sentiment(self.cfg.START_DATE)
-        sent_latest_date = sent.index.max().date()
+        sent_latest_date = sent.index[-1].date()
         sent_latest_value = sent.iloc[-1]['consumer_sentiment']
         sent_new = self._compare_new_data(sent, "consumer_sentiment.txt")
 
@@ -205,7 +205,7 @@ class CreditMonitor:
 
         # ---------- 🟠 VIX Volatility Index ----------
         vix = fetch_vix(self.cfg.START_DATE)
-        vix_latest_date = vix.index.max().date()
+        vix_latest_date = vix.index[-1].date()
         vix_latest_value = vix.iloc[-1]['vix']
         vix_new = self._compare_new_data(vix, "vix.txt")
 
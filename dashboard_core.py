@@ -0,0 +1,621 @@
+"""
+dashboard_core.py — Shared Credit Dashboard Logic
+---------------------------------------------
+Used by the Dash entry points (app.py, app_v7.py, app_v9.py; app_v2/app_v4/app_old
+keep their own loader and chart but share the table and Telegram send path):
+- Shared Flask server + Flask-Caching backend
+- FRED data loader (cached, merged, 2-year window)
+- Chart builders (stress z-scores, all-indicator z-scores, raw values),
+  threshold cards, and summary table
+- Page layout + refresh/Telegram callbacks, registered per entry point
+"""
+
+import time
+import asyncio
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from dash import html, dcc, dash_table, Patch, Output, Input, State, no_update
+import dash_bootstrap_components as dbc
+from flask import Flask
+from flask_caching import Cache
+
+from credit_monitor_extended import (
+    Config, TelegramNotifier,
+    fetch_consumer_credit, fetch_hy_spread,
+    fetch_nfci, fetch_sentiment, fetch_vix
+)
+from fred_cache import cached_fetch
+
+# ============================================================
+# 1️⃣ Setup
+# ============================================================
+cfg = Config()
+server = Flask(__name__)
+
+# Shared across gunicorn workers; switch CACHE_TYPE to "RedisCache" for multi-host deploys
+cache = Cache(server, config={
+    "CACHE_TYPE": "FileSystemCache",
+    "CACHE_DIR": ".cache/flask",
+    "CACHE_DEFAULT_TIMEOUT": 3600
+})
+
+# ============================================================
+# 2️⃣ Data Loader
+# ============================================================
+# (fetch function, FRED series id) — network-bound, so fetched concurrently
+FETCHERS = [
+    (fetch_consumer_credit, "TOTALSLAR"),
+    (fetch_hy_spread, "BAMLH0A0HYM2"),
+    (fetch_nfci, "NFCI"),
+    (fetch_sentiment, "UMCSENT"),
+    (fetch_vix, "VIXCLS")
+]
+
+
+def load_data() -> pd.DataFrame:
+    """Merged 2-year frame; in-process, then Flask cache, then FRED — all per clock hour."""
+    return _load_data_cached(int(time.time() // 3600))
+
+
+@lru_cache(maxsize=2)
+def _load_data_cached(hour_key: int) -> pd.DataFrame:
+    # repeat callbacks skip the Flask-cache unpickle
+    return _build_merged(hour_key)
+
+
+@cache.memoize(timeout=3600)
+def _build_merged(hour_key: int) -> pd.DataFrame:
+    # hour_key is part of the memoize key, so the Flask entry (shared across workers and
+    # restarts) rolls over on the same clock hour as every other layer, not 1h after its write
+
+    # --- FredFetcher's disk cache rolls on the same clock hour; misses hit FRED in parallel ---
+    with ThreadPoolExecutor(max_workers=len(FETCHERS)) as ex:
+        cc, hy, nf, sent, vix = ex.map(
+            lambda job: cached_fetch(job[0], job[1], cfg.START_DATE), FETCHERS
+        )
+
+    series = [
+        cc["pct_change_consumer_credit"],
+        hy["hy_oas_bps"],
+        nf["nfci"],
+        sent["consumer_sentiment"],
+        vix["vix"]
+    ]
+
+    columns = [
+        "Consumer Credit Growth (%)",
+        "HY Spread (bps)",
+        "NFCI Index",
+        "Consumer Sentiment Index",
+        "VIX Index"
+    ]
+
+    # --- Forward-fill each series onto one business-day calendar, then align in a single concat ---
+    # (identical indexes mean the concat has no gaps left to ffill; empty series come back all-NaN)
+    ends = [s.index[-1] for s in series if not s.empty]
+    if not ends:
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name="DATE"), dtype="float32")
+    end = max(ends)
+    idx = pd.date_range(start=cfg.START_DATE, end=end, freq="B", name="DATE")
+
+    # --- Trim to the last 2 years before filling: searchsorted on the sorted calendar ---
+    # (reindex's ffill still seeds the first row from observations before the cutoff)
+    idx = idx[idx.searchsorted(idx[-1] - pd.DateOffset(years=2)):]
+    df = pd.concat([s.reindex(idx, method="ffill") for s in series], axis=1)
+    df.columns = columns
+    return df
+
+
+def load_latest() -> dict | None:
+    """Last merged row as {column: float}, read off the in-process cached frame."""
+    df = load_data()
+    if df.empty:
+        return None
+    return dict(zip(df.columns, df.iloc[-1].to_numpy(dtype=float).tolist()))
+
+
+# ============================================================
+# 3️⃣ Chart Builders
+# ============================================================
+# --- Colors and friendly labels ---
+SERIES_INFO = {
+    "HY Spread (bps)": {"color": "red", "label": "HY Spread — Risk Premium"},
+    "VIX Index": {"color": "orange", "label": "VIX — Market Volatility"},
+    "Consumer Sentiment Index": {"color": "purple", "label": "Sentiment — Consumer Confidence"}
+}
+
+
+def _build_base_layout() -> dict:
+    """Static layout (template expanded once); make_chart only fills in the data-dependent keys."""
+    return go.Layout(
+        title="Normalized U.S. Market Stress & Sentiment Indicators (Z-Scores)",
+        xaxis_title="Date",
+        xaxis_type="date",  # x is sent as epoch-ms ints, drawn as dates
+        yaxis_title="Standardized Value (Z-Score)",
+        template="plotly_white",
+        height=650,
+        legend=dict(
+            orientation="h",
+            y=-0.25,
+            font=dict(size=11)
+        )
+    ).to_plotly_json()
+
+
+def _build_empty_figure() -> dict:
+    fig = go.Figure()
+    fig.add_annotation(
+        text="⚠️ No data available from FRED.",
+        xref="paper", yref="paper", showarrow=False,
+        font=dict(size=16, color="red"), x=0.5, y=0.5
+    )
+    return fig.to_plotly_json()
+
+
+_BASE_LAYOUT = _build_base_layout()
+_EMPTY_FIG = _build_empty_figure()
+
+# Per-trace point budget sent to the browser, shared by all three chart builders
+# (a 2-year business-day window is ~520 points, so today it only guards longer windows)
+MAX_POINTS = 2000
+
+
+def _minmax_indices(y: np.ndarray, n_out: int = MAX_POINTS) -> np.ndarray:
+    """Sorted row indices keeping each bucket's min and max, so peaks survive downsampling."""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    n_bins = (n_out - 2) // 2  # a min and a max per bucket, plus both endpoints: <= n_out
+    edges = np.linspace(0, n, n_bins + 1).astype(np.int64)
+    bins = np.repeat(np.arange(n_bins), np.diff(edges))
+    order = np.lexsort((y, bins))  # by bucket, then value
+    keep = np.concatenate([order[edges[:-1]], order[edges[1:] - 1], [0, n - 1]])
+    return np.unique(keep)
+
+
+def _decimate(s: pd.Series) -> pd.Series:
+    """Series capped at MAX_POINTS by _minmax_indices (NaN gaps dropped only when decimating)."""
+    if len(s) <= MAX_POINTS:
+        return s
+    s = s.dropna()
+    return s.iloc[_minmax_indices(s.to_numpy())]
+
+
+def make_chart(df) -> dict:
+    """Figure as a plain dict — skips go.Figure validation on every refresh."""
+    if df.empty:
+        return _EMPTY_FIG
+
+    # --- Keep the 3 key indicators (stats below are taken on this slice only) ---
+    cols = list(SERIES_INFO)
+    df = df[cols].dropna()
+    if df.empty:
+        return _EMPTY_FIG
+
+    # --- Normalize to Z-scores (one in-place NumPy pass; ddof=1 matches pandas .std()) ---
+    arr = df.to_numpy(dtype=np.float32, copy=True)
+    mu = arr.mean(axis=0)
+    sd = arr.std(axis=0, ddof=1)
+    np.subtract(arr, mu, out=arr)
+    np.divide(arr, sd, out=arr)
+
+    # --- Compute z-score thresholds (one vector op, reusing mu/sd) ---
+    thresh_raw = np.array([cfg.HY_SPREAD_THRESHOLD, cfg.VIX_THRESHOLD, cfg.SENTIMENT_THRESHOLD], dtype=np.float32)
+    thresh_z = ((thresh_raw - mu) / sd).tolist()
+
+    # --- Epoch-ms ints serialize as plain numbers (no per-point datetime formatting) ---
+    x_ms = df.index.as_unit("ms").asi8
+
+    # --- Solid main data lines (min/max-decimated past MAX_POINTS) ---
+    data = []
+    for i, info in enumerate(SERIES_INFO.values()):
+        keep = _minmax_indices(arr[:, i])
+        data.append(dict(
+            type="scattergl",  # WebGL: faster first paint and pan/zoom than SVG
+            x=x_ms[keep],
+            y=arr[keep, i],
+            mode="lines",
+            name=info["label"],
+            line=dict(color=info["color"], width=2)
+        ))
+
+    # --- Dashed threshold lines (semi-transparent), same shapes/annotations as fig.add_hline ---
+    shapes, annotations = [], []
+    for z_thresh, info in zip(thresh_z, SERIES_INFO.values()):
+        shapes.append(dict(
+            type="line", xref="x domain", x0=0, x1=1, yref="y", y0=z_thresh, y1=z_thresh,
+            line=dict(color=info["color"], dash="dot"),
+            opacity=0.6  # 👈 soft opacity for cleaner visual hierarchy
+        ))
+        annotations.append(dict(
+            text=f"{info['label']} threshold (z={z_thresh:.2f})",
+            xref="x domain", x=1, xanchor="right", yref="y", y=z_thresh, yanchor="bottom",
+            showarrow=False, font=dict(size=10, color=info["color"])
+        ))
+
+    # --- Fixed vertical range ---
+    y_min = float(arr.min())
+    layout = {
+        **_BASE_LAYOUT,
+        "shapes": shapes,
+        "annotations": annotations,
+        "yaxis": {**_BASE_LAYOUT["yaxis"], "range": [y_min - 1, 8]}
+    }
+
+    return dict(data=data, layout=layout)
+
+
+def make_chart_zscore(df) -> dict:
+    """All 5 indicators as z-scores, each with its threshold line (app_v9)."""
+    if df.empty:
+        return _EMPTY_FIG
+
+    # --- Compute z-score normalization (2 reductions, reused below) ---
+    means = df.mean()
+    stds = df.std()
+    df_norm = ((df - means) / stds).astype("float32")  # float32 halves the trace payload
+
+    # --- Compute threshold z-scores (one vector op) ---
+    thresh_series = pd.Series({
+        "Consumer Credit Growth (%)": cfg.CREDIT_THRESHOLD,
+        "HY Spread (bps)": cfg.HY_SPREAD_THRESHOLD,
+        "NFCI Index": cfg.NFCI_THRESHOLD,
+        "Consumer Sentiment Index": cfg.SENTIMENT_THRESHOLD,
+        "VIX Index": cfg.VIX_THRESHOLD
+    })
+    thresh_values = (thresh_series - means) / stds
+
+    colors = {
+        "Consumer Credit Growth (%)": "blue",
+        "HY Spread (bps)": "red",
+        "NFCI Index": "green",
+        "Consumer Sentiment Index": "purple",
+        "VIX Index": "orange"
+    }
+
+    fig = go.Figure()
+
+    # --- Plot normalized data (solid lines, min/max-decimated past MAX_POINTS) ---
+    for col, color in colors.items():
+        s = _decimate(df_norm[col])
+        fig.add_trace(go.Scattergl(
+            x=s.index, y=s,
+            mode="lines", name=col,
+            line=dict(color=color, width=2)
+        ))
+
+    # --- Plot dashed threshold lines (same color) ---
+    for col, color in colors.items():
+        z_thresh = thresh_values[col]
+        fig.add_hline(
+            y=z_thresh,
+            line_dash="dot",
+            line_color=color,
+            annotation_text=f"{col} thresh (z={z_thresh:.2f})",
+            annotation_position="top right",  # 🟢 move labels to right edge
+            annotation_font=dict(size=10, color=color)
+        )
+
+    # --- Expand vertical range for readability ---
+    y_min = df_norm.min().min()
+    y_max = df_norm.max().max()
+    margin = (y_max - y_min) * 0.3  # add 30% margin
+    fig.update_yaxes(range=[y_min - margin, y_max + margin])
+
+    fig.update_layout(
+        title="Normalized U.S. Credit Market Indicators (Z-Scores)",
+        xaxis_title="Date",
+        yaxis_title="Standardized Value (Z-Score)",
+        template="plotly_white",
+        height=650,  # slightly taller
+        legend=dict(orientation="h", y=-0.25)
+    )
+
+    return fig.to_plotly_json()
+
+
+def make_chart_raw(df) -> dict:
+    """All 5 indicators in their own units, one stacked y-axis each (app_v7)."""
+    if df.empty:
+        return _EMPTY_FIG
+
+    # --- load_data() frames are already float32 (half the trace payload) ---
+    # (each column min/max-decimated past MAX_POINTS)
+    cols = {col: _decimate(df[col]) for col in df.columns}
+    fig = go.Figure()
+
+    # --- Add traces for all 5 indicators ---
+    fig.add_trace(go.Scattergl(
+        x=cols["Consumer Credit Growth (%)"].index, y=cols["Consumer Credit Growth (%)"],
+        name="Consumer Credit Growth (%)",
+        line=dict(color="blue", width=2), yaxis="y"
+    ))
+    fig.add_trace(go.Scattergl(
+        x=cols["HY Spread (bps)"].index, y=cols["HY Spread (bps)"],
+        name="HY Spread (bps)",
+        line=dict(color="red", width=2), yaxis="y2"
+    ))
+    fig.add_trace(go.Scattergl(
+        x=cols["NFCI Index"].index, y=cols["NFCI Index"],
+        name="NFCI Index",
+        line=dict(color="green", width=2, dash="dash"), yaxis="y3"
+    ))
+    fig.add_trace(go.Scattergl(
+        x=cols["Consumer Sentiment Index"].index, y=cols["Consumer Sentiment Index"],
+        name="Consumer Sentiment Index",
+        line=dict(color="purple", width=2, dash="dot"), yaxis="y4"
+    ))
+    fig.add_trace(go.Scattergl(
+        x=cols["VIX Index"].index, y=cols["VIX Index"],
+        name="VIX Index",
+        line=dict(color="orange", width=2, dash="dot"), yaxis="y5"
+    ))
+
+    # --- Layout with all positions ≤ 1.0 ---
+    fig.update_layout(
+        title="U.S. Credit Market Indicators (Raw Values)",
+        xaxis=dict(title="Date"),
+
+        # Left axis
+        yaxis=dict(
+            title=dict(text="Consumer Credit Growth (%)", font=dict(color="blue")),
+            tickfont=dict(color="blue")
+        ),
+
+        # Right-side stacked axes (0.90 to 0.995)
+        yaxis2=dict(
+            title=dict(text="HY Spread (bps)", font=dict(color="red")),
+            tickfont=dict(color="red"),
+            overlaying="y", side="right", position=0.90
+        ),
+        yaxis3=dict(
+            title=dict(text="NFCI Index", font=dict(color="green")),
+            tickfont=dict(color="green"),
+            overlaying="y", side="right", position=0.94
+        ),
+        yaxis4=dict(
+            title=dict(text="Consumer Sentiment", font=dict(color="purple")),
+            tickfont=dict(color="purple"),
+            overlaying="y", side="right", position=0.97
+        ),
+        yaxis5=dict(
+            title=dict(text="VIX", font=dict(color="orange")),
+            tickfont=dict(color="orange"),
+            overlaying="y", side="right", position=0.995
+        ),
+
+        legend=dict(orientation="h", y=-0.25),
+        template="plotly_white",
+        height=650
+    )
+
+    # --- Add threshold lines (within valid ranges) ---
+    try:
+        fig.add_hline(y=cfg.CREDIT_THRESHOLD, line_dash="dot", line_color="blue",
+                      annotation_text="Credit Thresh")
+        fig.add_hline(y=cfg.HY_SPREAD_THRESHOLD, line_dash="dot", line_color="red",
+                      annotation_text="HY Thresh")
+        fig.add_hline(y=cfg.NFCI_THRESHOLD, line_dash="dot", line_color="green",
+                      annotation_text="NFCI Thresh")
+        fig.add_hline(y=cfg.SENTIMENT_THRESHOLD, line_dash="dot", line_color="purple",
+                      annotation_text="Sentiment Thresh")
+        fig.add_hline(y=cfg.VIX_THRESHOLD, line_dash="dot", line_color="orange",
+                      annotation_text="VIX Thresh")
+    except Exception as e:
+        print(f"[Warning] Could not draw threshold lines: {e}")
+
+    return fig.to_plotly_json()
+
+
+# Chart kinds an entry point can register (see register_callbacks)
+CHART_BUILDERS = {
+    "stress": make_chart,
+    "zscore": make_chart_zscore,
+    "raw": make_chart_raw
+}
+
+
+def make_chart_patch(fig: dict) -> Patch:
+    """Delta update for an already-rendered chart: trace arrays + threshold lines only."""
+    patch = Patch()
+    for i, trace in enumerate(fig["data"]):
+        patch["data"][i]["x"] = trace["x"]
+        patch["data"][i]["y"] = trace["y"]
+    layout = fig["layout"]
+    for key in ("shapes", "annotations"):
+        if key in layout:
+            patch["layout"][key] = layout[key]
+    if "range" in layout.get("yaxis", {}):
+        patch["layout"]["yaxis"]["range"] = layout["yaxis"]["range"]
+    return patch
+
+
+def snapshot_key(df: pd.DataFrame) -> str:
+    """Identify a load_data() snapshot by its last date and a hash of its contents."""
+    if df.empty:
+        return "empty"
+    # content hash: a new monthly/weekly print or a revision changes the key even
+    # when the newest date (and so the business-day calendar) stays the same
+    digest = int(pd.util.hash_pandas_object(df).sum())
+    return f"{df.index[-1]:%Y-%m-%d}|{digest:016x}"
+
+
+@cache.memoize(timeout=3600)
+def build_chart_json(df_key: str, chart: str = "stress") -> dict:
+    """Pre-serialized CHART_BUILDERS[chart] figure for the snapshot identified by df_key."""
+    return CHART_BUILDERS[chart](load_data())
+
+
+# ============================================================
+# 4️⃣ Threshold Display
+# ============================================================
+def make_threshold_cards(cfg: Config):
+    thresholds = {
+        "Consumer Credit Growth (%)": f"< {cfg.CREDIT_THRESHOLD:.2f}%",
+        "HY Spread (bps)": f"> {cfg.HY_SPREAD_THRESHOLD:.0f} bps",
+        "NFCI Index": f"> {cfg.NFCI_THRESHOLD:.2f}",
+        "Consumer Sentiment Index": f"< {cfg.SENTIMENT_THRESHOLD:.0f}",
+        "VIX Index": f"> {cfg.VIX_THRESHOLD:.0f}"
+    }
+
+    cards = []
+    for k, v in thresholds.items():
+        cards.append(
+            dbc.Card(
+                dbc.CardBody([
+                    html.H6(k, className="card-title"),
+                    html.P(v, className="card-text fw-bold text-danger mb-0")
+                ]),
+                className="text-center shadow-sm",
+                style={"minWidth": "12rem", "margin": "6px", "flex": "1"}
+
+            )
+        )
+
+    return dbc.Row(
+        [dbc.Col(card, width="auto") for card in cards],
+        justify="center",
+        className="mb-4"
+    )
+
+
+# cfg is fixed for the process lifetime, so the cards are built once
+THRESHOLD_CARDS = make_threshold_cards(cfg)
+
+
+# ============================================================
+# 5️⃣ Summary Table Builder
+# ============================================================
+def make_summary_table(df: pd.DataFrame):
+    if df.empty:
+        return html.P("⚠️ No data available", className="text-danger")
+
+    # --- Last 3 observations per indicator, melted in one vectorized pass ---
+    s = df.unstack().dropna()  # column-major: (Indicator, Date)
+    s.index.names = ["Indicator", "Date"]
+    table_df = s.groupby(level="Indicator", sort=False).tail(3).reset_index(name="Value")
+    table_df["Date"] = table_df["Date"].dt.strftime("%Y-%m-%d")
+    table_df["Value"] = table_df["Value"].astype("float64").round(2)
+
+    return dash_table.DataTable(
+        data=table_df.to_dict("records"),
+        columns=[{"name": i, "id": i} for i in table_df.columns],
+        style_table={"overflowX": "auto", "width": "100%"},
+        style_cell={"textAlign": "center", "padding": "6px"},
+        style_header={"backgroundColor": "#f8f9fa", "fontWeight": "bold"},
+        page_size=15
+    )
+
+
+# ============================================================
+# 6️⃣ Layout
+# ============================================================
+def build_layout(refresh_ms: int = 3600 * 1000):
+    """Dashboard page; refresh_ms sets the auto-refresh interval."""
+    return dbc.Container([
+        html.H2("📊 U.S. Credit Market Dashboard"),
+        html.P("Tracking Consumer Credit (TOTALSLAR), HY Spread (BAMLH0A0HYM2), NFCI, "
+               "Consumer Sentiment (UMCSENT), and VIX (VIXCLS)."),
+
+        # Chart
+        dcc.Graph(
+            id="credit_chart",
+            style={"height": "600px", "width": "100%"},
+            config={"responsive": True}
+        ),
+        dcc.Store(id="chart_key"),  # snapshot currently drawn, so refreshes can send deltas
+
+        html.Br(),
+
+        # Thresholds Section
+        html.H5("📉 Alert Thresholds"),
+        html.Div(THRESHOLD_CARDS, id="threshold_cards"),  # static: built once from cfg
+        html.Br(),
+
+        # Summary Table
+        html.H5("Latest Readings"),
+        html.Div(id="summary_table"),
+        html.Br(),
+
+        # Telegram Section
+        dbc.Button("🚀 Send Telegram Summary", id="send_btn", color="success", className="me-2"),
+        html.Span(id="status", className="text-info"),
+        html.Br(),
+
+        # Auto-refresh
+        dcc.Interval(
+            id="refresh",
+            interval=refresh_ms,
+            n_intervals=0
+        )
+
+    ], fluid=True, className="p-4")
+
+
+# ============================================================
+# 7️⃣ Callbacks
+# ============================================================
+@lru_cache(maxsize=1)
+def get_notifier() -> TelegramNotifier:
+    """Build the Telegram Bot on first send, not at import (keeps cold start lean)."""
+    return TelegramNotifier(cfg.TELEGRAM_TOKEN, cfg.CHAT_ID)
+
+
+# Long-lived loop for Telegram sends: the callback returns immediately, no loop
+# setup/teardown per click, and the Bot's HTTP pool stays bound to one loop
+SEND_LOOP = asyncio.new_event_loop()
+threading.Thread(target=SEND_LOOP.run_forever, name="telegram-loop", daemon=True).start()
+
+
+def queue_telegram(msg: str) -> str:
+    """Queue msg on SEND_LOOP and return the status line for the callback."""
+    asyncio.run_coroutine_threadsafe(get_notifier().send(msg), SEND_LOOP)
+    return f"✅ Telegram summary queued at {datetime.now().strftime('%H:%M:%S')}"
+
+
+def register_callbacks(app, chart: str = "stress"):
+    """Wire the refresh and Telegram callbacks onto app, drawing CHART_BUILDERS[chart]."""
+
+    @app.callback(
+        Output("credit_chart", "figure"),
+        Output("summary_table", "children"),
+        Output("chart_key", "data"),
+        Input("refresh", "n_intervals"),
+        State("chart_key", "data"),
+    )
+    def update_dashboard(n_intervals, prev_key):
+        df = load_data()
+        key = snapshot_key(df)
+        table = make_summary_table(df)  # cheap: always rebuilt so the readings never lag
+        if key == prev_key:
+            return no_update, table, no_update  # chart already shows this snapshot
+        fig = build_chart_json(key, chart)
+        if prev_key in (None, "empty") or key == "empty":
+            figure = fig  # first render (or trace count changes): full figure
+        else:
+            figure = make_chart_patch(fig)  # layout already in the browser: data only
+        return figure, table, key
+
+    @app.callback(
+        Output("status", "children"),
+        Input("send_btn", "n_clicks"),
+        prevent_initial_call=True
+    )
+    def send_summary(n_clicks):
+        vals = load_latest()
+        if vals is None:
+            return "⚠️ Data unavailable — cannot send summary."
+        msg = (
+            f"📊 <b>Credit Dashboard Update ({datetime.now():%Y-%m-%d %H:%M})</b>\n"
+            f"• Consumer Credit: {vals['Consumer Credit Growth (%)']:.2f}%\n"
+            f"• HY Spread: {vals['HY Spread (bps)']:.0f} bps\n"
+            f"• NFCI: {vals['NFCI Index']:.2f}\n"
+            f"• Sentiment: {vals['Consumer Sentiment Index']:.2f}\n"
+            f"• VIX: {vals['VIX Index']:.2f}"
+        )
+        return queue_telegram(msg)
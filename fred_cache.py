@@ -0,0 +1,73 @@
+"""
+fred_cache.py
+--------------------------------
+Caching for FRED fetches:
+- FileCache: the one disk layer, used by FredFetcher for raw FRED responses
+- Each entry is a Parquet file under .cache/fred/ (dtypes + DatetimeIndex preserved)
+- A sidecar .meta.json holds the UTC write timestamp; rewriting a key overwrites it
+- Entries are fresh within the TTL window they were written in (default: the clock hour),
+  so they roll over together with the dashboard's per-hour caches
+- cached_fetch: in-process only (lru_cache per TTL window), downcasting floats to float32
+"""
+
+import os
+import json
+import time
+import hashlib
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# 1️⃣ File Cache
+# ============================================================
+class FileCache:
+    """Parquet + JSON-meta cache keyed by md5(series_id + key)."""
+    def __init__(self, cache_dir: str = os.path.join(".cache", "fred"), ttl: int = 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _paths(self, series_id: str, key: str) -> tuple[str, str]:
+        digest = hashlib.md5(f"{series_id}{key}".encode()).hexdigest()
+        base = os.path.join(self.cache_dir, f"{series_id}_{digest}")
+        return f"{base}.parquet", f"{base}.meta.json"
+
+    def get(self, series_id: str, key: str) -> pd.DataFrame | None:
+        data_path, meta_path = self._paths(series_id, key)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta["ts"] // self.ttl != time.time() // self.ttl:
+                return None  # written in an earlier TTL window
+            return pd.read_parquet(data_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, series_id: str, key: str, df: pd.DataFrame):
+        data_path, meta_path = self._paths(series_id, key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_parquet(data_path)
+            with open(meta_path, "w") as f:
+                json.dump({"ts": time.time(), "series": series_id, "key": key}, f)
+        except Exception as e:
+            print(f"⚠️ Cache write error ({series_id}): {e}")
+
+
+# ============================================================
+# 2️⃣ Cached Fetch Helper
+# ============================================================
+def _to_float32(df: pd.DataFrame) -> pd.DataFrame:
+    cols = df.select_dtypes(include="float64").columns
+    return df.astype({col: np.float32 for col in cols})
+
+
+@lru_cache(maxsize=16)
+def _memory_fetch(fn, series_id: str, start: str, bucket: int) -> pd.DataFrame:
+    # bucket = TTL window index; the disk layer lives in FredFetcher, below fn
+    return _to_float32(fn(start))
+
+
+def cached_fetch(fn, series_id: str, start: str, ttl: int = 3600) -> pd.DataFrame:
+    """Return fn(start) as float32, held in memory for the current TTL window."""
+    return _memory_fetch(fn, series_id, start, int(time.time() // ttl))